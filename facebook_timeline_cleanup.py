@@ -19,19 +19,124 @@ import random
 import os
 import sys
 import json
+import copy
+import shutil
+import subprocess
+import tempfile
+import urllib.request
 from datetime import datetime, timedelta
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Selenium is heavy to import and not needed for --help or --save-config,
+# it is loaded by import_selenium() when a FacebookCleaner is created
+webdriver = By = WebDriverWait = EC = Options = ActionChains = TimeoutException = None
+
+# Locator strategies (values of selenium's By.CSS_SELECTOR and By.XPATH),
+# usable in class-level locators before selenium is imported
+CSS_SELECTOR = "css selector"
+XPATH = "xpath"
+
+# Parsed configuration files, keyed by (path, mtime_ns, size)
+_CONFIG_CACHE = {}
+
+def import_selenium():
+    """Import selenium modules into module globals on first use"""
+    global webdriver, By, WebDriverWait, EC, Options, ActionChains, TimeoutException
+    
+    if webdriver is not None:
+        return
+    
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.action_chains import ActionChains
+    from selenium.common.exceptions import TimeoutException
+
 class FacebookCleaner:
     """Main class for automated Facebook timeline cleaning"""
     
+    # Elements that only appear once logged in
+    LOGGED_IN_MARKER = (
+        CSS_SELECTOR,
+        "[data-testid='search'], [aria-label*='main menu'], [data-testid='blue_bar_profile_link']"
+    )
+    
+    # Activity log container, present once the posts list has rendered
+    ACTIVITY_MARKER = (
+        CSS_SELECTOR,
+        "[data-pagelet='ActivityLogList'], [data-testid='activity-log-item']"
+    )
+    
+    # Posts in activity log, in order of preference. These selectors nest
+    # (a list row contains the item, which contains the article), so only the
+    # first one that matches is used
+    POST_SELECTORS = [
+        "[data-testid='activity-log-item']",
+        "[data-pagelet='ActivityLogList'] > div",
+        ".userContentWrapper",
+        "[role='article']",
+        "[data-testid='fbfeed_story']"
+    ]
+    
+    # Locator lists below are in order of preference, the first match wins.
+    # Text matches use XPath (CSS has no text matching) and are scoped to the
+    # open menu or dialog so that post content is never clicked.
+    
+    # Post menu button, searched inside the post
+    MENU_SELECTORS = [
+        "[aria-label*='More options']",
+        "[aria-label*='Altre opzioni']",
+        "[data-testid='post_menu']",
+        ".UFIMoreButton",
+        "[aria-haspopup='menu']"
+    ]
+    
+    # Delete option in the opened post menu
+    DELETE_LOCATORS = [
+        (CSS_SELECTOR, "[data-testid*='delete']"),
+        (XPATH, "//*[@role='menu']//*[@role='menuitem'][contains(., 'Delete') or contains(., 'Elimina')]"),
+        (XPATH, "//*[@role='menu']//a[contains(., 'Delete') or contains(., 'Elimina')]")
+    ]
+    
+    # Confirm button in the deletion dialog
+    CONFIRM_LOCATORS = [
+        (CSS_SELECTOR, "[data-testid='confirm-delete-button']"),
+        (XPATH, "//*[@role='dialog']//button[contains(., 'Delete') or contains(., 'Elimina')]"),
+        (CSS_SELECTOR, "[role='dialog'] [aria-label*='Confirm']"),
+        (CSS_SELECTOR, "[role='dialog'] [aria-label*='Conferma']")
+    ]
+    
+    # Cookie banner accept button
+    COOKIE_LOCATORS = [
+        (CSS_SELECTOR, "[data-testid='cookie-policy-manage-dialog'] button"),
+        (CSS_SELECTOR, "[data-cookiebanner='accept_button']"),
+        (CSS_SELECTOR, "button[title*='Accept']"),
+        (CSS_SELECTOR, "button[title*='Accetta']")
+    ]
+    
+    # Activity log link on the profile page
+    ACTIVITY_LINK_LOCATORS = [
+        (CSS_SELECTOR, "a[href*='allactivity']"),
+        (CSS_SELECTOR, "a[href*='activity']"),
+        (CSS_SELECTOR, "[data-testid*='activity']"),
+        (XPATH, "//a[contains(., 'Activity Log') or contains(., 'Registro attività')]")
+    ]
+    
+    # Timestamp candidates inside a post, in order of preference
+    TIMESTAMP_SELECTORS = [
+        "[data-testid='story-subtitle'] a",
+        ".timestampContent",
+        "time",
+        "[title*='20']"  # Year in title
+    ]
+    
     def __init__(self, config):
         """
         Initialize Facebook Cleaner with provided configuration
@@ -39,12 +144,21 @@ class FacebookCleaner:
         Args:
             config (dict): Dictionary with all configurations
         """
+        import_selenium()
+        
         self.config = config
         self.email = config['credentials']['email']
         self.password = config['credentials']['password']
         self.whatif = config['execution']['whatif']
         self.verbose = config['execution']['verbose']
         
+        # Timing values used on every action
+        self.page_timeout = config['timing']['page_timeout']
+        self.min_action_delay = config['timing']['min_action_delay']
+        self.max_action_delay = config['timing']['max_action_delay']
+        self.min_delete_delay = config['timing']['min_delete_delay']
+        self.max_delete_delay = config['timing']['max_delete_delay']
+        
         # Session statistics
         self.stats = {
             'posts_found': 0,
@@ -58,7 +172,10 @@ class FacebookCleaner:
         # Selenium driver and objects
         self.driver = None
         self.wait = None
+        self.short_wait = None
+        self.scroll_wait = None
         self.actions = None
+        self.own_window = None
         
         # Setup logging and driver
         self.setup_logging()
@@ -92,13 +209,13 @@ class FacebookCleaner:
         self.logger.addHandler(console_handler)
         
         # File handler
-        log_filename = f"facebook_timeline_cleanup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+        self.log_filename = f"facebook_timeline_cleanup_{time.strftime('%Y%m%d_%H%M%S')}.log"
+        file_handler = logging.FileHandler(self.log_filename, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
         self.logger.addHandler(file_handler)
         
-        self.logger.info(f"Logging system initialized. Log file: {log_filename}")
+        self.logger.info(f"Logging system initialized. Log file: {self.log_filename}")
         
         if self.whatif:
             self.logger.warning("WHATIF MODE ACTIVE - No actual deletions will be performed")
@@ -109,6 +226,9 @@ class FacebookCleaner:
         
         options = Options()
         
+        # Return from navigation at DOMContentLoaded instead of waiting for every subresource
+        options.page_load_strategy = 'eager'
+        
         # Base configurations
         if self.config['browser']['headless'] and not self.verbose:
             options.add_argument('--headless')
@@ -121,6 +241,14 @@ class FacebookCleaner:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         
+        # Skip images and media: cleaning only reads post text and clicks menus
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.images": 2,
+            "profile.managed_default_content_settings.media_stream": 2
+        })
+        
         # Realistic user agent
         user_agent = self.config['browser']['user_agent']
         options.add_argument(f'--user-agent={user_agent}')
@@ -131,12 +259,19 @@ class FacebookCleaner:
             options.add_argument(f'--window-size={window_size["width"]},{window_size["height"]}')
         
         try:
-            self.driver = webdriver.Chrome(options=options)
-            self.wait = WebDriverWait(self.driver, self.config['timing']['page_timeout'])
+            if self.config['browser'].get('persistent_session', False):
+                self.driver = self.attach_persistent_browser(options.arguments)
+            else:
+                self.driver = webdriver.Chrome(options=options)
+            self.wait = WebDriverWait(self.driver, self.page_timeout)
+            self.short_wait = WebDriverWait(self.driver, 2)
+            self.scroll_wait = WebDriverWait(self.driver, 5)
             self.actions = ActionChains(self.driver)
             
-            # Remove automation flag
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            # Remove automation flag at document start of every page, before site scripts run
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+            })
             
             self.logger.info("Chrome driver initialized successfully")
             
@@ -144,6 +279,117 @@ class FacebookCleaner:
             self.logger.error(f"Error initializing driver: {e}")
             raise
     
+    def attach_persistent_browser(self, chrome_arguments):
+        """
+        Attach to a Chrome instance kept alive between runs, launching it if needed
+        
+        Args:
+            chrome_arguments (list): Command line switches used when launching Chrome
+            
+        Returns:
+            webdriver.Chrome: Driver attached to a new tab of the persistent browser
+        """
+        browser_config = self.config['browser']
+        debugging_port = browser_config.get('debugging_port', 9222)
+        debugger_address = f"127.0.0.1:{debugging_port}"
+        
+        if not self.is_debugger_available(debugger_address):
+            chrome_binary = browser_config.get('chrome_binary') or self.find_chrome_binary()
+            if not chrome_binary:
+                raise RuntimeError("Chrome executable not found, set 'chrome_binary' in browser configuration")
+            
+            user_data_dir = browser_config.get('user_data_dir') or os.path.join(
+                os.path.expanduser('~'), '.facebook_timeline_cleanup', 'chrome-profile'
+            )
+            
+            # This browser outlives the run with a logged-in profile: keep its sandbox on
+            # and keep it visible, so that it can be closed like any other window
+            launch_arguments = [
+                argument for argument in chrome_arguments
+                if argument not in ('--no-sandbox', '--disable-dev-shm-usage', '--headless')
+            ]
+            if '--headless' in chrome_arguments:
+                self.logger.warning("Headless mode ignored for the persistent browser, it stays visible to be closed")
+            
+            self.logger.info(f"Launching persistent Chrome on {debugger_address}")
+            subprocess.Popen(
+                [chrome_binary,
+                 f"--remote-debugging-port={debugging_port}",
+                 f"--user-data-dir={user_data_dir}",
+                 *launch_arguments],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+            
+            for _ in range(20):
+                if self.is_debugger_available(debugger_address):
+                    break
+                time.sleep(0.5)
+            else:
+                raise RuntimeError(f"Persistent Chrome did not open debugging port {debugger_address}")
+        else:
+            self.logger.info(f"Reusing persistent Chrome on {debugger_address}")
+        
+        # Launch switches are fixed once Chrome runs, attaching accepts only the address
+        attach_options = Options()
+        attach_options.page_load_strategy = 'eager'
+        attach_options.add_experimental_option("debuggerAddress", debugger_address)
+        driver = webdriver.Chrome(options=attach_options)
+        
+        # Work in a dedicated tab so that only this tab is closed on exit
+        driver.switch_to.new_window('tab')
+        self.own_window = driver.current_window_handle
+        
+        return driver
+    
+    def find_chrome_binary(self):
+        """
+        Locate the Chrome executable on PATH or in the standard install
+        locations of Windows and macOS
+        
+        Returns:
+            str: Path of the Chrome executable, or None if not found
+        """
+        for name in ('google-chrome', 'google-chrome-stable', 'chrome', 'chromium', 'chromium-browser'):
+            path = shutil.which(name)
+            if path:
+                return path
+        
+        candidates = []
+        
+        if sys.platform == 'win32':
+            for env_var in ('PROGRAMFILES', 'PROGRAMFILES(X86)', 'LOCALAPPDATA'):
+                base_dir = os.environ.get(env_var)
+                if base_dir:
+                    candidates.append(os.path.join(base_dir, 'Google', 'Chrome', 'Application', 'chrome.exe'))
+        elif sys.platform == 'darwin':
+            app_binary = os.path.join('Google Chrome.app', 'Contents', 'MacOS', 'Google Chrome')
+            candidates.append(os.path.join('/Applications', app_binary))
+            candidates.append(os.path.join(os.path.expanduser('~'), 'Applications', app_binary))
+        
+        for candidate in candidates:
+            if os.path.isfile(candidate):
+                return candidate
+        
+        return None
+    
+    def is_debugger_available(self, debugger_address):
+        """
+        Check whether a Chrome DevTools endpoint is listening
+        
+        Args:
+            debugger_address (str): host:port of the debugging endpoint
+            
+        Returns:
+            bool: True if the endpoint answers, False otherwise
+        """
+        try:
+            with urllib.request.urlopen(f"http://{debugger_address}/json/version", timeout=1):
+                return True
+        except OSError:
+            return False
+    
     def human_like_delay(self, min_delay=None, max_delay=None):
         """
         Implement realistic pauses between actions to simulate human behavior
@@ -153,40 +399,55 @@ class FacebookCleaner:
             max_delay (float): Maximum delay in seconds
         """
         if min_delay is None:
-            min_delay = self.config['timing']['min_action_delay']
+            min_delay = self.min_action_delay
         if max_delay is None:
-            max_delay = self.config['timing']['max_action_delay']
+            max_delay = self.max_action_delay
             
         delay = random.uniform(min_delay, max_delay)
         
         if self.verbose:
-            self.logger.debug(f"Human-like pause of {delay:.2f} seconds")
+            self.logger.debug("Human-like pause of %.2f seconds", delay)
         
         time.sleep(delay)
     
+    def _cdp_eval(self, expression):
+        """
+        Evaluate a JavaScript expression directly through Chrome DevTools Protocol,
+        bypassing the WebDriver command layer
+        
+        Args:
+            expression (str): JavaScript expression (not a function body)
+            
+        Returns:
+            JSON-serializable value of the expression
+        """
+        response = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True,
+            "awaitPromise": False
+        })
+        return response['result'].get('value')
+    
     def wait_for_page_load(self, timeout=None):
         """
-        Wait for complete page loading
+        Wait until the page DOM is ready
         
         Args:
             timeout (int): Timeout in seconds
         """
         if timeout is None:
-            timeout = self.config['timing']['page_timeout']
+            timeout = self.page_timeout
             
         self.logger.debug("Waiting for page load...")
         
         try:
-            # Wait for jQuery to complete (if present)
+            # DOM ready (matching the eager load strategy) and jQuery activity (if present)
+            # in one round-trip per poll
             self.wait.until(
-                lambda driver: driver.execute_script("return jQuery.active == 0") 
-                if driver.execute_script("return typeof jQuery != 'undefined'") 
-                else True
-            )
-            
-            # Wait for document ready state
-            self.wait.until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
+                lambda driver: self._cdp_eval(
+                    "document.readyState !== 'loading' && "
+                    "(typeof jQuery === 'undefined' || jQuery.active === 0)"
+                )
             )
             
             self.logger.debug("Page loading completed")
@@ -212,20 +473,24 @@ class FacebookCleaner:
             # Handle cookie banner if present
             self.handle_cookie_banner()
             
-            # Email input
+            # Email input, or a logged-in page when a persistent browser
+            # profile still holds a valid session
             self.logger.debug("Looking for email field...")
             email_field = self.wait.until(
-                EC.presence_of_element_located((By.ID, "email"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, f"#email, {self.LOGGED_IN_MARKER[1]}"))
             )
             
+            if email_field.get_attribute('id') != 'email':
+                self.logger.info("Already logged in from existing browser session")
+                return True
+            
             if self.whatif:
                 self.logger.info(f"WHATIF: Would enter email in field (email hidden for security)")
             else:
                 self.logger.debug("Entering email...")
                 email_field.clear()
-                for char in self.email:
-                    email_field.send_keys(char)
-                    time.sleep(random.uniform(0.05, 0.15))
+                email_field.send_keys(self.email)
+                self.human_like_delay(0.3, 0.8)
             
             self.human_like_delay(1, 2)
             
@@ -238,9 +503,8 @@ class FacebookCleaner:
             else:
                 self.logger.debug("Entering password...")
                 password_field.clear()
-                for char in self.password:
-                    password_field.send_keys(char)
-                    time.sleep(random.uniform(0.05, 0.15))
+                password_field.send_keys(self.password)
+                self.human_like_delay(0.3, 0.8)
             
             self.human_like_delay(1, 3)
             
@@ -253,19 +517,13 @@ class FacebookCleaner:
                 return True
             else:
                 self.logger.debug("Clicking login button...")
-                self.actions.move_to_element(login_button).click().perform()
+                login_button.click()
             
             # Verify successful login
             self.logger.debug("Verifying login completion...")
             try:
                 # Wait for elements indicating successful login
-                self.wait.until(
-                    EC.any_of(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='search']")),
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "[aria-label*='main menu']")),
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='blue_bar_profile_link']"))
-                    )
-                )
+                self.wait.until(EC.presence_of_element_located(self.LOGGED_IN_MARKER))
                 
                 self.logger.info("Login completed successfully")
                 return True
@@ -293,42 +551,88 @@ class FacebookCleaner:
                 self.logger.debug(f"Full stack trace: {e}")
             return False
     
+    def first_clickable(self, locators):
+        """
+        Build a wait condition returning the first visible and enabled element,
+        trying locators in order of preference
+        
+        Args:
+            locators (list): (strategy, selector) tuples, most preferred first
+            
+        Returns:
+            callable: Condition for WebDriverWait.until
+        """
+        # Resolve every locator and check visibility in the page, one round-trip per poll
+        script = """
+            const isClickable = element => {
+                const style = window.getComputedStyle(element);
+                return element.getClientRects().length > 0
+                    && style.visibility !== 'hidden'
+                    && !element.disabled
+                    && element.getAttribute('aria-disabled') !== 'true';
+            };
+            for (const [strategy, selector] of arguments[0]) {
+                let candidates;
+                if (strategy === 'xpath') {
+                    const result = document.evaluate(
+                        selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+                    );
+                    candidates = Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+                } else {
+                    candidates = Array.from(document.querySelectorAll(selector));
+                }
+                const element = candidates.find(isClickable);
+                if (element) {
+                    return element;
+                }
+            }
+            return null;
+        """
+        
+        def condition(driver):
+            return driver.execute_script(script, [list(locator) for locator in locators]) or False
+        
+        return condition
+    
     def handle_cookie_banner(self):
         """Handle cookie banner if present"""
         try:
             self.logger.debug("Checking for cookie banner...")
             
-            # Common selectors for Facebook cookie banners
-            cookie_selectors = [
-                "[data-testid='cookie-policy-manage-dialog'] button",
-                "[data-cookiebanner='accept_button']",
-                "button[title*='Accept']",
-                "button[title*='Accetta']"
-            ]
-            
-            for selector in cookie_selectors:
-                try:
-                    cookie_button = WebDriverWait(self.driver, 2).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    
-                    if self.whatif:
-                        self.logger.info("WHATIF: Would click accept cookies button (not executed)")
-                    else:
-                        self.logger.debug("Clicking accept cookies button")
-                        cookie_button.click()
-                        self.human_like_delay(1, 2)
-                    
-                    return
-                    
-                except TimeoutException:
-                    continue
-            
-            self.logger.debug("No cookie banner found")
+            try:
+                cookie_button = self.short_wait.until(self.first_clickable(self.COOKIE_LOCATORS))
+                
+                if self.whatif:
+                    self.logger.info("WHATIF: Would click accept cookies button (not executed)")
+                else:
+                    self.logger.debug("Clicking accept cookies button")
+                    cookie_button.click()
+                    self.human_like_delay(1, 2)
+                
+            except TimeoutException:
+                self.logger.debug("No cookie banner found")
             
         except Exception as e:
             self.logger.debug(f"Error handling cookie banner: {e}")
     
+    def wait_for_activity_log(self):
+        """
+        Wait until the activity log posts list is rendered
+        
+        Returns:
+            bool: True if the list appeared, False on timeout
+        """
+        self.logger.debug("Waiting for activity log to render...")
+        
+        try:
+            self.wait.until(EC.presence_of_element_located(self.ACTIVITY_MARKER))
+            self.logger.debug("Activity log rendered")
+            return True
+            
+        except TimeoutException:
+            self.logger.warning(f"Timeout waiting for activity log ({self.page_timeout}s)")
+            return False
+    
     def navigate_to_activity_log(self):
         """
         Navigate to activity log with advanced error handling
@@ -348,7 +652,7 @@ class FacebookCleaner:
                 return True
             
             self.driver.get(activity_url)
-            self.wait_for_page_load()
+            self.wait_for_activity_log()
             
             # Verify we're on the correct page
             if "allactivity" in self.driver.current_url or "activity" in self.driver.current_url:
@@ -361,30 +665,19 @@ class FacebookCleaner:
             self.wait_for_page_load()
             
             # Look for activity log link
-            activity_selectors = [
-                "a[href*='allactivity']",
-                "a[href*='activity']",
-                "[data-testid*='activity']",
-                "a:contains('Activity Log')",
-                "a:contains('Registro attività')"
-            ]
-            
-            for selector in activity_selectors:
-                try:
-                    activity_link = self.wait.until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    
-                    self.logger.debug(f"Found activity log link: {selector}")
-                    activity_link.click()
-                    self.wait_for_page_load()
-                    
-                    if "allactivity" in self.driver.current_url or "activity" in self.driver.current_url:
-                        self.logger.info("Navigation to activity log completed via profile")
-                        return True
-                    
-                except TimeoutException:
-                    continue
+            try:
+                activity_link = self.wait.until(self.first_clickable(self.ACTIVITY_LINK_LOCATORS))
+                
+                self.logger.debug("Found activity log link")
+                activity_link.click()
+                self.wait_for_activity_log()
+                
+                if "allactivity" in self.driver.current_url or "activity" in self.driver.current_url:
+                    self.logger.info("Navigation to activity log completed via profile")
+                    return True
+                
+            except TimeoutException:
+                pass
             
             self.logger.error("Unable to navigate to activity log")
             return False
@@ -393,6 +686,52 @@ class FacebookCleaner:
             self.logger.error(f"Error navigating to activity log: {e}")
             return False
     
+    def query_posts(self):
+        """
+        Return the elements matched by the first post selector that matches
+        anything, resolved in a single round-trip
+        
+        Returns:
+            list: Post elements in document order
+        """
+        return self.driver.execute_script(
+            """
+            for (const selector of arguments[0]) {
+                const found = document.querySelectorAll(selector);
+                if (found.length) {
+                    return Array.from(found);
+                }
+            }
+            return [];
+            """,
+            self.POST_SELECTORS
+        )
+    
+    def find_menu_button(self, post_element):
+        """
+        Find the menu button of a post, trying menu selectors in order of
+        preference within a single round-trip
+        
+        Args:
+            post_element: Selenium element of the post
+            
+        Returns:
+            Menu button element, or None if no selector matches
+        """
+        return self.driver.execute_script(
+            """
+            for (const selector of arguments[1]) {
+                const found = arguments[0].querySelector(selector);
+                if (found) {
+                    return found;
+                }
+            }
+            return null;
+            """,
+            post_element,
+            self.MENU_SELECTORS
+        )
+    
     def find_posts_on_page(self):
         """
         Find all posts present on current page
@@ -402,38 +741,22 @@ class FacebookCleaner:
         """
         self.logger.debug("Searching for posts on current page...")
         
-        # Multiple selectors for posts in activity log
-        post_selectors = [
-            "[data-testid='activity-log-item']",
-            "[data-pagelet='ActivityLogList'] > div",
-            ".userContentWrapper",
-            "[role='article']",
-            "[data-testid='fbfeed_story']"
-        ]
-        
-        all_posts = []
-        
-        for selector in post_selectors:
-            try:
-                posts = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if posts:
-                    self.logger.debug(f"Found {len(posts)} posts with selector: {selector}")
-                    all_posts.extend(posts)
-                    break
-                    
-            except Exception as e:
-                self.logger.debug(f"Error with selector {selector}: {e}")
-                continue
+        try:
+            all_posts = self.query_posts()
+            self.logger.debug("Found %d candidate post elements", len(all_posts))
+        except Exception as e:
+            self.logger.debug("Error searching for posts: %s", e)
+            all_posts = []
         
-        # Remove duplicates while maintaining order
+        # Remove duplicates while maintaining order, keyed on the WebDriver element
+        # reference so no extra round-trips are needed
         unique_posts = []
         seen_elements = set()
         
         for post in all_posts:
-            element_id = post.get_attribute('data-testid') or post.get_attribute('id') or str(hash(post.text[:50]))
-            if element_id not in seen_elements:
+            if post.id not in seen_elements:
                 unique_posts.append(post)
-                seen_elements.add(element_id)
+                seen_elements.add(post.id)
         
         self.logger.info(f"Found {len(unique_posts)} unique posts on page")
         self.stats['posts_found'] += len(unique_posts)
@@ -451,7 +774,7 @@ class FacebookCleaner:
         Returns:
             bool: True if deletion successful, False otherwise
         """
-        self.logger.debug(f"Attempting deletion of post {post_index + 1}")
+        self.logger.debug("Attempting deletion of post %d", post_index + 1)
         
         try:
             # Scroll to post to make it visible
@@ -468,50 +791,26 @@ class FacebookCleaner:
                 return True
             
             # Look for post menu button
-            menu_selectors = [
-                "[aria-label*='More options']",
-                "[aria-label*='Altre opzioni']",
-                "[data-testid='post_menu']",
-                ".UFIMoreButton",
-                "[aria-haspopup='menu']"
-            ]
-            
-            menu_button = None
-            for selector in menu_selectors:
-                try:
-                    menu_button = post_element.find_element(By.CSS_SELECTOR, selector)
-                    break
-                except NoSuchElementException:
-                    continue
+            menu_button = self.find_menu_button(post_element)
             
             if not menu_button:
                 self.logger.warning(f"Menu not found for post {post_index + 1}")
                 self.stats['posts_skipped'] += 1
                 return False
             
-            # Click on menu
-            self.logger.debug(f"Clicking menu for post {post_index + 1}")
+            # Click on menu (hover first, some menus only react once revealed);
+            # clear queued actions so the shared chain does not replay them next time
+            self.logger.debug("Clicking menu for post %d", post_index + 1)
             self.actions.move_to_element(menu_button).click().perform()
+            self.actions.reset_actions()
             self.human_like_delay(1, 3)
             
             # Look for delete option
-            delete_selectors = [
-                "[data-testid*='delete']",
-                "a:contains('Delete')",
-                "a:contains('Elimina')",
-                "[role='menuitem']:contains('Delete')",
-                "[role='menuitem']:contains('Elimina')"
-            ]
-            
             delete_option = None
-            for selector in delete_selectors:
-                try:
-                    delete_option = self.wait.until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    break
-                except TimeoutException:
-                    continue
+            try:
+                delete_option = self.wait.until(self.first_clickable(self.DELETE_LOCATORS))
+            except TimeoutException:
+                pass
             
             if not delete_option:
                 self.logger.warning(f"Delete option not found for post {post_index + 1}")
@@ -519,31 +818,19 @@ class FacebookCleaner:
                 return False
             
             # Click delete
-            self.logger.debug(f"Clicking delete for post {post_index + 1}")
+            self.logger.debug("Clicking delete for post %d", post_index + 1)
             delete_option.click()
             self.human_like_delay(1, 2)
             
             # Confirm deletion
-            confirm_selectors = [
-                "[data-testid='confirm-delete-button']",
-                "button:contains('Delete')",
-                "button:contains('Elimina')",
-                "[aria-label*='Confirm']",
-                "[aria-label*='Conferma']"
-            ]
-            
             confirm_button = None
-            for selector in confirm_selectors:
-                try:
-                    confirm_button = self.wait.until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    break
-                except TimeoutException:
-                    continue
+            try:
+                confirm_button = self.wait.until(self.first_clickable(self.CONFIRM_LOCATORS))
+            except TimeoutException:
+                pass
             
             if confirm_button:
-                self.logger.debug(f"Confirming deletion of post {post_index + 1}")
+                self.logger.debug("Confirming deletion of post %d", post_index + 1)
                 confirm_button.click()
                 self.human_like_delay(2, 4)
                 
@@ -571,27 +858,29 @@ class FacebookCleaner:
             str: String with post information
         """
         try:
-            # Extract post text (first 100 characters)
-            post_text = post_element.text[:100].replace('\n', ' ').strip()
-            
-            # Extract timestamp if available
-            timestamp_selectors = [
-                "[data-testid='story-subtitle'] a",
-                ".timestampContent",
-                "time",
-                "[title*='20']"  # Year in title
-            ]
+            # Read text and timestamp in a single round-trip
+            full_text, timestamp = self.driver.execute_script(
+                """
+                const post = arguments[0];
+                let timestamp = null;
+                for (const selector of arguments[1]) {
+                    const element = post.querySelector(selector);
+                    if (element) {
+                        timestamp = element.getAttribute('title') || element.innerText;
+                        break;
+                    }
+                }
+                return [post.innerText || '', timestamp];
+                """,
+                post_element,
+                self.TIMESTAMP_SELECTORS
+            )
             
-            timestamp = "Unknown timestamp"
-            for selector in timestamp_selectors:
-                try:
-                    time_element = post_element.find_element(By.CSS_SELECTOR, selector)
-                    timestamp = time_element.get_attribute('title') or time_element.text
-                    break
-                except NoSuchElementException:
-                    continue
+            # Extract post text (first 100 characters)
+            post_text = full_text[:100].replace('\n', ' ').strip()
+            timestamp = timestamp or "Unknown timestamp"
             
-            return f"[{timestamp}] {post_text}{'...' if len(post_element.text) > 100 else ''}"
+            return f"[{timestamp}] {post_text}{'...' if len(full_text) > 100 else ''}"
             
         except Exception as e:
             return f"Error extracting info: {e}"
@@ -623,19 +912,16 @@ class FacebookCleaner:
         
         # Process each post
         for i, post in enumerate(posts_to_process):
-            self.logger.debug(f"Processing post {i + 1}/{len(posts_to_process)}")
+            self.logger.debug("Processing post %d/%d", i + 1, len(posts_to_process))
             
             if self.attempt_post_deletion(post, i):
                 deleted_count += 1
                 
                 # Pause between deletions
-                delay = random.uniform(
-                    self.config['timing']['min_delete_delay'],
-                    self.config['timing']['max_delete_delay']
-                )
+                delay = random.uniform(self.min_delete_delay, self.max_delete_delay)
                 
                 if self.verbose:
-                    self.logger.debug(f"Pause of {delay:.2f}s before next post")
+                    self.logger.debug("Pause of %.2fs before next post", delay)
                 
                 time.sleep(delay)
             
@@ -651,6 +937,30 @@ class FacebookCleaner:
         self.logger.info(f"Batch completed: {deleted_count} posts deleted")
         return deleted_count
     
+    def load_more_posts(self, max_attempts=2):
+        """
+        Load further posts by scrolling the infinite activity log,
+        reloading the page only if scrolling brings nothing new
+        
+        Args:
+            max_attempts (int): Scroll attempts before falling back to a reload
+        """
+        last_count = len(self.query_posts())
+        
+        for attempt in range(max_attempts):
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            
+            try:
+                self.scroll_wait.until(lambda driver: len(self.query_posts()) > last_count)
+                self.logger.debug("New posts loaded after scroll")
+                return
+            except TimeoutException:
+                self.logger.debug("No new posts after scroll attempt %d/%d", attempt + 1, max_attempts)
+        
+        self.logger.debug("Scrolling loaded no posts, refreshing page...")
+        self.driver.refresh()
+        self.wait_for_activity_log()
+    
     def clean_profile_gradually(self):
         """
         Execute gradual profile cleaning according to configured parameters
@@ -679,12 +989,11 @@ class FacebookCleaner:
             self.logger.info(f"SESSION {session + 1}/{max_sessions}")
             self.logger.info(f"Target: {posts_per_session} posts for this session")
             
-            # Refresh page to see new posts
+            # Load further posts for this session
             if session > 0:
-                self.logger.debug("Refreshing page for new posts...")
+                self.logger.debug("Loading more posts...")
                 if not self.whatif:
-                    self.driver.refresh()
-                    self.wait_for_page_load()
+                    self.load_more_posts()
                     self.human_like_delay(3, 5)
             
             # Delete batch of posts
@@ -698,15 +1007,12 @@ class FacebookCleaner:
                 self.logger.info(f"Pause between sessions: {session_delay} seconds")
                 
                 if self.verbose:
-                    # Show countdown of pause
-                    remaining = session_delay
-                    while remaining > 0:
-                        mins, secs = divmod(remaining, 60)
-                        timer = f"{mins:02d}:{secs:02d}"
-                        print(f"\rNext session in: {timer}", end="", flush=True)
-                        time.sleep(1)
-                        remaining -= 1
-                    print()  # New line after countdown
+                    # Report remaining pause at 10% intervals instead of every second
+                    step = session_delay / 10
+                    for elapsed_steps in range(10):
+                        mins, secs = divmod(int(session_delay - elapsed_steps * step), 60)
+                        self.logger.debug(f"Next session in: {mins:02d}:{secs:02d}")
+                        time.sleep(step)
                 else:
                     time.sleep(session_delay)
             
@@ -770,14 +1076,21 @@ class FacebookCleaner:
         if self.whatif:
             print("To actually perform deletions, remove the --whatif parameter")
         else:
-            print(f"Deletions completed. Detailed log saved to: facebook_timeline_cleanup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+            print(f"Deletions completed. Detailed log saved to: {self.log_filename}")
     
     def close(self):
         """Close driver and release resources"""
         self.logger.info("Closing driver and cleaning up resources...")
         
         try:
-            if self.driver:
+            if self.driver and self.own_window:
+                # Persistent browser: close only our tab and detach, leaving Chrome running
+                if len(self.driver.window_handles) > 1:
+                    self.driver.switch_to.window(self.own_window)
+                    self.driver.close()
+                self.driver.quit()
+                self.logger.info("Detached from persistent browser")
+            elif self.driver:
                 self.driver.quit()
                 self.logger.info("Driver closed successfully")
         except Exception as e:
@@ -814,7 +1127,11 @@ def create_default_config():
             "window_size": {
                 "width": 1366,
                 "height": 768
-            }
+            },
+            "persistent_session": False,
+            "debugging_port": 9222,
+            "user_data_dir": "",
+            "chrome_binary": ""
         },
         "execution": {
             "whatif": False,
@@ -824,7 +1141,9 @@ def create_default_config():
 
 def load_config_from_file(config_path):
     """
-    Load configuration from JSON file
+    Load configuration from JSON file. Known sections are applied over the
+    default configuration, so keys missing from the file keep their defaults
+    and unknown top-level entries (comments, examples) are dropped.
     
     Args:
         config_path (str): Configuration file path
@@ -833,8 +1152,32 @@ def load_config_from_file(config_path):
         dict: Loaded configuration
     """
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        stat = os.stat(config_path)
+        cache_key = (os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)
+        
+        if cache_key not in _CONFIG_CACHE:
+            with open(config_path, 'rb') as f:
+                data = f.read()
+            file_config = orjson.loads(data) if orjson else json.loads(data.decode('utf-8'))
+            
+            if not isinstance(file_config, dict):
+                print("Error parsing configuration file: top level must be an object")
+                return None
+            
+            known_sections = create_default_config().keys()
+            _CONFIG_CACHE[cache_key] = {
+                section: values for section, values in file_config.items() if section in known_sections
+            }
+        
+        config = create_default_config()
+        
+        # Callers update the configuration in place, copy the cached values
+        for section, values in copy.deepcopy(_CONFIG_CACHE[cache_key]).items():
+            if isinstance(values, dict):
+                config[section].update(values)
+            else:
+                config[section] = values
+        
         print(f"Configuration loaded from: {config_path}")
         return config
     except FileNotFoundError:
@@ -853,20 +1196,56 @@ def save_config_template(config_path):
     """
     config = create_default_config()
     
+    if orjson:
+        data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(config, indent=4, ensure_ascii=False).encode('utf-8')
+    
+    # Write to a temporary file in a single call, then swap it in atomically
+    # so an interrupted save never leaves a truncated configuration behind
+    temp_path = None
+    
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4, ensure_ascii=False)
+        temp_fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(config_path)))
+        with os.fdopen(temp_fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, config_path)
         print(f"Configuration template saved to: {config_path}")
         print("Edit the file with your credentials and preferences before use.")
     except Exception as e:
+        if temp_path:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
         print(f"Error saving template: {e}")
 
-def parse_arguments():
+# Command line arguments mapped to configuration (section, key, argument name)
+ARGUMENT_CONFIG_FIELDS = (
+    ('credentials', 'email', 'email'),
+    ('credentials', 'password', 'password'),
+    ('cleaning', 'max_sessions', 'sessions'),
+    ('cleaning', 'posts_per_session', 'posts_per_session'),
+    ('timing', 'session_delay', 'session_delay'),
+    ('timing', 'page_timeout', 'page_timeout'),
+    ('timing', 'min_action_delay', 'min_delay'),
+    ('timing', 'max_action_delay', 'max_delay'),
+    ('browser', 'headless', 'headless'),
+    ('browser', 'user_agent', 'user_agent'),
+    ('browser', 'persistent_session', 'persistent_browser'),
+    ('execution', 'whatif', 'whatif'),
+    ('execution', 'verbose', 'verbose'),
+)
+
+# Full command line parser, built on first use by parse_arguments()
+_PARSER = None
+
+def _build_parser():
     """
-    Parse command line arguments
+    Build the full command line parser
     
     Returns:
-        argparse.Namespace: Parsed arguments
+        argparse.ArgumentParser: Parser with all argument groups
     """
     parser = argparse.ArgumentParser(
         description="Facebook Timeline Cleanup - Gradually delete posts from your Facebook timeline",
@@ -909,79 +1288,141 @@ Security notes:
     
     # Cleaning group
     clean_group = parser.add_argument_group('cleaning parameters')
-    clean_group.add_argument('--sessions', type=int, default=5,
+    clean_group.add_argument('--sessions', type=int,
                             help='Maximum number of sessions (default: 5)')
-    clean_group.add_argument('--posts-per-session', type=int, default=10,
+    clean_group.add_argument('--posts-per-session', type=int,
                             help='Posts to delete per session (default: 10)')
-    clean_group.add_argument('--session-delay', type=int, default=300,
+    clean_group.add_argument('--session-delay', type=int,
                             help='Pause between sessions in seconds (default: 300)')
     
     # Timing group
     timing_group = parser.add_argument_group('timing parameters')
-    timing_group.add_argument('--page-timeout', type=int, default=30,
+    timing_group.add_argument('--page-timeout', type=int,
                              help='Page load timeout in seconds (default: 30)')
-    timing_group.add_argument('--min-delay', type=float, default=1.0,
+    timing_group.add_argument('--min-delay', type=float,
                              help='Minimum delay between actions in seconds (default: 1.0)')
-    timing_group.add_argument('--max-delay', type=float, default=3.0,
+    timing_group.add_argument('--max-delay', type=float,
                              help='Maximum delay between actions in seconds (default: 3.0)')
     
     # Browser group
     browser_group = parser.add_argument_group('browser parameters')
-    browser_group.add_argument('--headless', action='store_true',
+    browser_group.add_argument('--headless', action='store_true', default=None,
                               help='Run in headless mode (no GUI)')
     browser_group.add_argument('--user-agent',
                               help='Custom user agent for browser')
+    browser_group.add_argument('--persistent-browser', action='store_true', default=None,
+                              help='Keep Chrome running between runs and reuse its profile and login')
     
     # Execution group
     exec_group = parser.add_argument_group('execution modes')
-    exec_group.add_argument('--whatif', '--dry-run', action='store_true',
+    exec_group.add_argument('--whatif', '--dry-run', action='store_true', default=None,
                            help='Simulation mode - does not actually delete anything')
-    exec_group.add_argument('--verbose', '-v', action='store_true',
+    exec_group.add_argument('--verbose', '-v', action='store_true', default=None,
                            help='Detailed output of all operations')
+    exec_group.add_argument('--yes', action='store_true',
+                           help="Skip the 'DELETE' confirmation prompt (required when not run from a terminal)")
+    
+    return parser
+
+def parse_arguments():
+    """
+    Parse command line arguments
     
-    return parser.parse_args()
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    global _PARSER
+    
+    # Template generation alone needs no other option, skip building the full parser.
+    # --help and any other argument still go through the full parser below.
+    argv = sys.argv[1:]
+    if (len(argv) == 2 and argv[0] == '--save-config' and argv[1]) or \
+            (len(argv) == 1 and argv[0].startswith('--save-config=') and argv[0] != '--save-config='):
+        save_parser = argparse.ArgumentParser(add_help=False)
+        save_parser.add_argument('--save-config')
+        return save_parser.parse_args(argv)
+    
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    
+    return _PARSER.parse_args()
 
 def merge_config_with_args(base_config, args):
     """
-    Merge base configuration with command line arguments
+    Merge base configuration with command line arguments.
+    Only arguments given on the command line override the configuration.
     
     Args:
-        base_config (dict): Base configuration
+        base_config (dict): Base configuration, updated in place
         args (argparse.Namespace): Command line arguments
         
     Returns:
         dict: Final configuration
     """
-    config = base_config.copy()
-    
-    # Update credentials
-    if args.email:
-        config['credentials']['email'] = args.email
-    if args.password:
-        config['credentials']['password'] = args.password
-    
-    # Update cleaning parameters
-    config['cleaning']['max_sessions'] = args.sessions
-    config['cleaning']['posts_per_session'] = args.posts_per_session
-    
-    # Update timing
-    config['timing']['session_delay'] = args.session_delay
-    config['timing']['page_timeout'] = args.page_timeout
-    config['timing']['min_action_delay'] = args.min_delay
-    config['timing']['max_action_delay'] = args.max_delay
-    
-    # Update browser
-    if args.headless:
-        config['browser']['headless'] = True
-    if args.user_agent:
-        config['browser']['user_agent'] = args.user_agent
-    
-    # Update execution
-    config['execution']['whatif'] = args.whatif
-    config['execution']['verbose'] = args.verbose
+    config = base_config
+    
+    for section, key, arg_name in ARGUMENT_CONFIG_FIELDS:
+        value = getattr(args, arg_name)
+        if value is not None:
+            config[section][key] = value
     
     return config
 
+# Expected value types per configuration section, checked before semantic rules.
+# A nested dict describes an object value with its own fields.
+CONFIG_SCHEMA = {
+    'credentials': {'email': str, 'password': str},
+    'cleaning': {'posts_per_session': int, 'max_sessions': int},
+    'timing': {
+        'session_delay': (int, float),
+        'page_timeout': (int, float),
+        'min_action_delay': (int, float),
+        'max_action_delay': (int, float),
+        'min_delete_delay': (int, float),
+        'max_delete_delay': (int, float)
+    },
+    'browser': {
+        'headless': bool,
+        'user_agent': str,
+        'window_size': {'width': int, 'height': int},
+        'persistent_session': bool,
+        'debugging_port': int,
+        'user_data_dir': str,
+        'chrome_binary': str
+    },
+    'execution': {'whatif': bool, 'verbose': bool}
+}
+
+def check_config_types(values, schema, path):
+    """
+    Check that an object holds all fields of a schema with the expected types
+    
+    Args:
+        values (dict): Object to check
+        schema (dict): Expected type (or nested schema) per field
+        path (str): Dotted path of the object, for error messages
+        
+    Returns:
+        str: Error message, or None if the object matches the schema
+    """
+    for key, expected_type in schema.items():
+        if key not in values:
+            return f"Configuration value '{path}.{key}' missing."
+        
+        value = values[key]
+        
+        if isinstance(expected_type, dict):
+            if not isinstance(value, dict):
+                return f"Configuration value '{path}.{key}' must be an object."
+            error = check_config_types(value, expected_type, f"{path}.{key}")
+            if error:
+                return error
+        # bool is a subclass of int, do not accept it for numeric values
+        elif not isinstance(value, expected_type) or (isinstance(value, bool) and expected_type is not bool):
+            return f"Configuration value '{path}.{key}' has invalid type {type(value).__name__}."
+    
+    return None
+
 def validate_config(config):
     """
     Validate configuration and check prerequisites
@@ -992,6 +1433,15 @@ def validate_config(config):
     Returns:
         tuple: (bool, str) - (validity, error message)
     """
+    # Check structure and value types
+    for section, fields in CONFIG_SCHEMA.items():
+        if not isinstance(config.get(section), dict):
+            return False, f"Configuration section '{section}' missing or not an object."
+        
+        error = check_config_types(config[section], fields, section)
+        if error:
+            return False, error
+    
     # Check credentials
     if not config['credentials']['email']:
         return False, "Email missing. Use --email or specify in configuration file."
@@ -1049,27 +1499,37 @@ def main():
     
     # Security warnings
     if not config['execution']['whatif']:
-        print("\nWARNING: You are about to actually delete posts from Facebook!")
-        print("This operation is NOT reversible.")
-        print("We recommend:")
-        print("1. Run first with --whatif to test")
-        print("2. Download a backup of your data from Facebook")
-        print("3. Start with a low number of posts per session")
-        
-        confirm = input("\nAre you sure you want to proceed? (type 'DELETE' to confirm): ")
-        if confirm != 'DELETE':
-            print("Operation cancelled.")
-            return 0
+        print("\n".join([
+            "\nWARNING: You are about to actually delete posts from Facebook!",
+            "This operation is NOT reversible.",
+            "We recommend:",
+            "1. Run first with --whatif to test",
+            "2. Download a backup of your data from Facebook",
+            "3. Start with a low number of posts per session"
+        ]))
+        
+        if args.yes:
+            print("\nConfirmation given with --yes.")
+        elif sys.stdin.isatty():
+            confirm = input("\nAre you sure you want to proceed? (type 'DELETE' to confirm): ")
+            if confirm != 'DELETE':
+                print("Operation cancelled.")
+                return 0
+        else:
+            print("\nERROR: No terminal to confirm deletion. Use --yes to confirm non-interactively.")
+            return 1
     
     # Session information
-    print(f"\nSession configuration:")
-    print(f"  Mode:                  {'SIMULATION (whatif)' if config['execution']['whatif'] else 'ACTUAL DELETION'}")
-    print(f"  Account:               {config['credentials']['email']}")
-    print(f"  Planned sessions:      {config['cleaning']['max_sessions']}")
-    print(f"  Posts per session:     {config['cleaning']['posts_per_session']}")
-    print(f"  Pause between sessions: {config['timing']['session_delay']} seconds")
-    print(f"  Verbose mode:          {'Yes' if config['execution']['verbose'] else 'No'}")
-    print(f"  Headless browser:      {'Yes' if config['browser']['headless'] else 'No'}")
+    print("\n".join([
+        "\nSession configuration:",
+        f"  Mode:                  {'SIMULATION (whatif)' if config['execution']['whatif'] else 'ACTUAL DELETION'}",
+        f"  Account:               {config['credentials']['email']}",
+        f"  Planned sessions:      {config['cleaning']['max_sessions']}",
+        f"  Posts per session:     {config['cleaning']['posts_per_session']}",
+        f"  Pause between sessions: {config['timing']['session_delay']} seconds",
+        f"  Verbose mode:          {'Yes' if config['execution']['verbose'] else 'No'}",
+        f"  Headless browser:      {'Yes' if config['browser']['headless'] else 'No'}"
+    ]))
     
     # Initialize cleaner
     cleaner = None